@@ -919,12 +919,13 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin):
                 # Combine the transactions
                 total_amount = 0
                 total_delta = 0
-                for tx in self.tx_notifications:
-                    if tx:
-                        for result in self._wallet.get_transaction_deltas(tx.hash()):
-                            total_amount += result.total
-                            total_delta += abs(result.total)
-                        n_ok += 1
+                tx_hashes = [ tx.hash() for tx in self.tx_notifications if tx ]
+                n_ok = len(tx_hashes)
+                deltas_by_hash = self._wallet.get_transaction_deltas_by_hash(tx_hashes)
+                for results in deltas_by_hash.values():
+                    for result in results:
+                        total_amount += result.total
+                        total_delta += abs(result.total)
                 if n_ok and total_delta:
                     self._logger.debug("Notifying GUI %d tx", n_ok)
                     if n_ok > 1:
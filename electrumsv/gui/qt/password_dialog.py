@@ -25,10 +25,9 @@
 
 import enum
 import math
-import re
 from typing import Any, Callable, List, Optional, Tuple, Union
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (
     QGridLayout, QLabel, QLineEdit, QPushButton, QVBoxLayout, QWidget
@@ -46,6 +45,15 @@ from .util import (
 
 MessageType = Union[str, List[Tuple[QWidget, QWidget]]]
 
+# The strength label is plain text and coloured with a style sheet, so that Qt does not have to
+# parse and lay out rich text on every update.
+PASSWORD_STRENGTH_STYLES = {
+    "Weak": "color: red",
+    "Medium": "color: blue",
+    "Strong": "color: green",
+    "Very Strong": "color: green",
+}
+
 
 def check_password_strength(password: str) -> str:
     '''
@@ -54,11 +62,27 @@ def check_password_strength(password: str) -> str:
     :return: password strength Weak or Medium or Strong
     '''
 
-    password = password
     n = math.log(len(set(password)))
-    num = re.search("[0-9]", password) is not None and re.match("^[0-9]*$", password) is None
-    caps = password != password.upper() and password != password.lower()
-    extra = re.match("^[a-zA-Z0-9]*$", password) is None
+    has_digit = has_nondigit = has_upper = has_lower = has_nonalnum = False
+    for c in password:
+        o = ord(c)
+        if 0x30 <= o <= 0x39:
+            has_digit = True
+            continue
+        has_nondigit = True
+        if 0x41 <= o <= 0x5A:
+            has_upper = True
+        elif 0x61 <= o <= 0x7A:
+            has_lower = True
+        else:
+            has_nonalnum = True
+            # Non-ASCII letters still count towards the password having mixed case, where a
+            # character counts if it changes under case conversion.
+            has_upper = has_upper or c.lower() != c
+            has_lower = has_lower or c.upper() != c
+    num = has_digit and has_nondigit
+    caps = has_upper and has_lower
+    extra = has_nonalnum
     score = len(password)*( n + caps + num + extra)/20
     password_strength = {0:"Weak",1:"Medium",2:"Strong",3:"Very Strong"}
     return password_strength[min(3, int(score))]
@@ -137,6 +161,7 @@ class PasswordLayout(object):
         self.new_pw = PasswordLineEdit()
         self.conf_pw = PasswordLineEdit()
         self.kind = kind
+        self._is_passphrase = kind == PasswordAction.PASSPHRASE
         self._state_change_fn = state_change_fn
 
         vbox = QVBoxLayout()
@@ -145,7 +170,7 @@ class PasswordLayout(object):
 
         form = FormSectionWidget(minimum_label_width=120)
 
-        if kind == PasswordAction.PASSPHRASE:
+        if self._is_passphrase:
             vbox.addWidget(label)
             msgs = [_('Passphrase:'), _('Confirm Passphrase:')]
         else:
@@ -180,19 +205,23 @@ class PasswordLayout(object):
         vbox.addWidget(form)
 
         # Password Strength Label
-        if kind != PasswordAction.PASSPHRASE:
+        if not self._is_passphrase:
             self._pw_strength = QLabel()
+            self._pw_strength.setTextFormat(Qt.PlainText)
             form.add_row(_("Password Strength"), self._pw_strength)
-            self.new_pw.textChanged.connect(self.pw_changed)
+            # Coalesce bursts of keystrokes so the strength is only evaluated once typing pauses.
+            self._pw_timer = QTimer(self._pw_strength)
+            self._pw_timer.setSingleShot(True)
+            self._pw_timer.setInterval(120)
+            self._pw_timer.timeout.connect(self.pw_changed)
+            self.new_pw.textChanged.connect(self._on_new_pw_text_changed)
             self.pw_changed()
 
         def enable_OK() -> None:
             new_password = self.new_pw.text().strip()
-            confirm_password = self.conf_pw.text().strip()
-            ok = len(new_password) and new_password == confirm_password
-            if password_valid_fn is not None:
-                existing_password = self.pw.text().strip()
-                ok = ok and password_valid_fn(existing_password)
+            ok = new_password != "" and new_password == self.conf_pw.text().strip()
+            if ok and password_valid_fn is not None:
+                ok = password_valid_fn(self.pw.text().strip())
             self._state_change_fn(ok)
 
         self.new_pw.textChanged.connect(enable_OK)
@@ -208,16 +237,18 @@ class PasswordLayout(object):
     def layout(self):
         return self.vbox
 
+    def _on_new_pw_text_changed(self, _text: str) -> None:
+        self._pw_timer.start()
+
     def pw_changed(self):
         password = self.new_pw.text()
-        label = ""
         strength_text = ""
+        strength_style = ""
         if password:
-            colors = {"Weak":"Red", "Medium":"Blue", "Strong":"Green",
-                      "Very Strong":"Green"}
-            strength = check_password_strength(password)
-            strength_text = "<font color="+ colors[strength] + ">" + strength + "</font>"
+            strength_text = check_password_strength(password)
+            strength_style = PASSWORD_STRENGTH_STYLES[strength_text]
         self._pw_strength.setText(strength_text)
+        self._pw_strength.setStyleSheet(strength_style)
 
     def old_password(self):
         if self.kind == PasswordAction.CHANGE:
@@ -227,7 +258,7 @@ class PasswordLayout(object):
     def new_password(self):
         pw = self.new_pw.text()
         # Empty passphrases are fine and returned empty.
-        if pw == "" and self.kind != PasswordAction.PASSPHRASE:
+        if pw == "" and not self._is_passphrase:
             pw = None
         return pw
 
@@ -24,6 +24,7 @@ from electrumsv.transaction import Transaction
 from electrumsv.util import profiler, format_time
 from electrumsv.wallet import AbstractAccount
 from electrumsv.wallet_database import TxData
+from electrumsv.wallet_database.tables import TransactionDeltaSumRow
 import electrumsv.web as web
 
 from .constants import ICON_NAME_INVOICE_PAYMENT
@@ -696,8 +697,11 @@ class TransactionView(QTableView):
         lines = []
         rows = self._wallet.read_transaction_metadatas(
                 mask=TxFlags.STATE_UNCLEARED_MASK, account_id=self._account_id)
+        deltas_by_hash = self._wallet.get_transaction_deltas_by_hash(
+            [ row[0] for row in rows ], self._account_id)
         for tx_hash, tx_flags, tx_data in rows:
-            lines.append(self._create_transaction_entry(tx_hash, tx_data))
+            lines.append(self._create_transaction_entry(tx_hash, tx_data,
+                deltas_by_hash.get(tx_hash, [])))
         return sorted(lines, key=get_sort_key)
 
     def _set_fiat_columns_enabled(self, flag: bool) -> None:
@@ -709,11 +713,13 @@ class TransactionView(QTableView):
 
         self.setColumnHidden(FIAT_VALUE_COLUMN, not flag)
 
-    def _create_transaction_entry(self, tx_hash: bytes, tx_data: TxData) -> None:
+    def _create_transaction_entry(self, tx_hash: bytes, tx_data: TxData,
+            results: Optional[List[TransactionDeltaSumRow]]=None) -> None:
         assert tx_data.date_added is not None, \
             f"{hash_to_hex_str(tx_hash)} has no valid date_added"
         tx_entry = self._account.get_transaction_entry(tx_hash)
-        results = self._wallet.get_transaction_deltas(tx_hash, self._account_id)
+        if results is None:
+            results = self._wallet.get_transaction_deltas(tx_hash, self._account_id)
         total_value  = results[0].total if len(results) else 0
         return TxLine(tx_hash, tx_data.date_added, tx_data.date_updated, tx_entry.flags,
             total_value)
@@ -67,16 +67,20 @@ class VirtualKeyboard(QWidget):
         self._refresh()
 
     def _refresh(self, _button=None):
-        random.shuffle(self.pages)
-        for button, page in zip(self.page_buttons, self.pages):
-            button.setIcon(read_QIcon(page.icon))
-            button.setToolTip(page.tooltip)
-            button.setDisabled(page is self.page)
-        self._shuffle_page()
+        # Every button gets relabelled, so hold off repainting until they all have been.
+        self.setUpdatesEnabled(False)
+        try:
+            random.shuffle(self.pages)
+            for button, page in zip(self.page_buttons, self.pages):
+                button.setIcon(read_QIcon(page.icon))
+                button.setToolTip(page.tooltip)
+                button.setDisabled(page is self.page)
+            self._shuffle_page()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _shuffle_page(self):
-        chars = list(self.page.chars)
-        random.shuffle(chars)
+        chars = random.sample(self.page.chars, len(self.page.chars))
         for n, char_button in enumerate(self.char_buttons):
             if n < len(chars):
                 char_button.setText(chars[n] if chars[n] != '&' else '&&')
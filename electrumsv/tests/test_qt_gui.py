@@ -105,3 +105,25 @@ class HistoryListTests(unittest.TestCase):
         self.assertNotEqual("...", time_string)
         self.assertEqual(time_string, get_tx_desc(TxStatus.FINAL, 1))
         self.assertEqual(_("unknown"), get_tx_desc(TxStatus.FINAL, False))
+
+
+class PasswordDialogTests(unittest.TestCase):
+    def test_check_password_strength(self) -> None:
+        from electrumsv.gui.qt.password_dialog import check_password_strength
+
+        assert "Weak" == check_password_strength("aaaaaaaa")
+        assert "Medium" == check_password_strength("aaaaaaaa1234")
+        assert "Strong" == check_password_strength("Straße12")
+        assert "Very Strong" == check_password_strength("Correct-Horse-Battery-Staple-42")
+
+    def test_check_password_strength_non_ascii_case(self) -> None:
+        from electrumsv.gui.qt.password_dialog import check_password_strength
+
+        # Characters with the upper or lowercase property but no case mapping are not mixed case.
+        assert "Weak" == check_password_strength("PGIVNº")
+        assert "Medium" == check_password_strength("MXZSOELDBº")
+        assert "Weak" == check_password_strength("ªªªªªªªªªªªªªªª")
+        assert "Medium" == check_password_strength("ℍℍℍℍℍℍaaaaaaaa")
+        # Titlecase letters are neither upper nor lowercase, but do change case.
+        assert "Medium" == check_password_strength("ǅǅǅǅǅǅǅǅǅǅǅǅǅǅǅǅ")
+        assert "Weak" == check_password_strength("ΣΑΣ")
@@ -23,8 +23,8 @@ from electrumsv.wallet_database import (migration, KeyInstanceTable, MasterKeyTa
 from electrumsv.wallet_database.sqlite_support import LeakedSQLiteConnectionError
 from electrumsv.wallet_database.tables import (AccountRow, InvoiceAccountRow, InvoiceRow,
     InvoiceTable, KeyInstanceRow, MAGIC_UNTOUCHED_BYTEDATA, MasterKeyRow, PaymentRequestRow,
-    TransactionDeltaRow, TransactionDeltaKeySummaryRow, TransactionRow, TransactionOutputRow,
-    WalletEventTable, WalletEventRow)
+    TEMP_IDS_THRESHOLD, TransactionDeltaRow, TransactionDeltaKeySummaryRow, TransactionRow,
+    TransactionOutputRow, WalletEventTable, WalletEventRow)
 
 
 logs.set_level("debug")
@@ -1153,6 +1153,15 @@ def test_table_transactiondeltas_crud(db_context: DatabaseContext) -> None:
         masterkey_id=MASTERKEY_ID, derivation_type=3, derivation_data=b'111', script_type=2,
         flags=1, date_updated=10, total_value=100.0, match_count=1)
 
+    # Enough ids to be read through the temporary id table, most of which do not match.
+    many_keyinstance_ids = [ KEYINSTANCE_ID ] + [ KEYINSTANCE_ID+1000+i for i in range(200) ]
+    assert len(many_keyinstance_ids) > TEMP_IDS_THRESHOLD
+    assert table.read_key_summary(ACCOUNT_ID, many_keyinstance_ids) == srows
+
+    hrows = table.read_history(ACCOUNT_ID, many_keyinstance_ids)
+    assert len(hrows) == 1
+    assert hrows[0].tx_hash == TX_HASH
+
     db_lines = table.read()
     assert 3 == len(db_lines)
 
@@ -1192,6 +1201,25 @@ def test_table_transactiondeltas_crud(db_context: DatabaseContext) -> None:
     # assert 0 == result.match_count
     # assert 0 == result.total
 
+    ## Test `read_transaction_values`
+    results_by_hash = table.read_transaction_values([ TX_HASH, TX_HASH2 ])
+    assert results_by_hash == { TX_HASH: table.read_transaction_value(TX_HASH) }
+
+    results_by_hash = table.read_transaction_values([ TX_HASH, TX_HASH2 ], ACCOUNT_ID)
+    assert results_by_hash == { TX_HASH: table.read_transaction_value(TX_HASH, ACCOUNT_ID) }
+
+    results_by_hash = table.read_transaction_values([ TX_HASH ], ACCOUNT_ID_OTHER)
+    assert results_by_hash == {}
+
+    # Any sequence of hashes is accepted, not only lists.
+    results_by_hash = table.read_transaction_values(( TX_HASH, TX_HASH2 ), ACCOUNT_ID)
+    assert results_by_hash == { TX_HASH: table.read_transaction_value(TX_HASH, ACCOUNT_ID) }
+
+    # Enough hashes to be read through the temporary id table.
+    many_tx_hashes = [ TX_HASH ] + [ os.urandom(32) for i in range(TEMP_IDS_THRESHOLD) ]
+    results_by_hash = table.read_transaction_values(many_tx_hashes, ACCOUNT_ID)
+    assert results_by_hash == { TX_HASH: table.read_transaction_value(TX_HASH, ACCOUNT_ID) }
+
     db_lines = table.read()
     assert 3 == len(db_lines)
     db_line2 = [ db_line for db_line in db_lines if db_line[0:2] == line2[0:2] ][0]
@@ -1214,6 +1242,9 @@ def test_table_transactiondeltas_crud(db_context: DatabaseContext) -> None:
         assert len(pr_rows) == 1
         assert pr_rows[0] == KEYINSTANCE_ID
 
+        pr_rows = table.read_paid_requests(ACCOUNT_ID, many_keyinstance_ids)
+        assert pr_rows == [ KEYINSTANCE_ID ]
+
         # Match on null is satisfied with any payment.
         pr_rows = table.read_paid_requests(ACCOUNT_ID, [ KEYINSTANCE_ID+2 ])
         assert len(pr_rows) == 1
@@ -2638,6 +2638,11 @@ class Wallet(TriggeredCallbacks):
         with TransactionDeltaTable(self.get_db_context()) as table:
             return table.read_transaction_value(tx_hash, account_id)
 
+    def get_transaction_deltas_by_hash(self, tx_hashes: Sequence[bytes],
+            account_id: Optional[int]=None) -> Dict[bytes, List[TransactionDeltaSumRow]]:
+        with TransactionDeltaTable(self.get_db_context()) as table:
+            return table.read_transaction_values(tx_hashes, account_id)
+
     def read_wallet_events(self, mask: WalletEventFlag=WalletEventFlag.NONE) \
             -> List[WalletEventRow]:
         with WalletEventTable(self.get_db_context()) as table:
@@ -2,4 +2,5 @@ from . import migration_0022_create_database
 from . import migration_0023_add_wallet_events
 from . import migration_0024_account_transactions
 from . import migration_0025_invoices
-from . import migration_0026_txo_coinbase_flag
\ No newline at end of file
+from . import migration_0026_txo_coinbase_flag
+from . import migration_0027_delta_indexes
\ No newline at end of file
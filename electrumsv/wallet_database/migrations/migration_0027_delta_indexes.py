@@ -0,0 +1,24 @@
+import json
+try:
+    # Linux expects the latest package version of 3.31.1 (as of p)
+    import pysqlite3 as sqlite3
+except ModuleNotFoundError:
+    # MacOS expects the latest brew version of 3.32.1 (as of 2020-07-10).
+    # Windows builds use the official Python 3.7.8 builds and version of 3.31.1.
+    import sqlite3 # type: ignore
+import time
+
+MIGRATION = 27
+
+def execute(conn: sqlite3.Connection) -> None:
+    # The existing unique index leads with the key, so lookups of the deltas for a given
+    # transaction scanned the whole table. This covers the columns the transaction value reads use.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_TransactionDeltas_tx_hash "
+        "ON TransactionDeltas(tx_hash, keyinstance_id, value_delta)")
+    # The balance, history and key summary reads all restrict the keys to a given account.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_KeyInstances_account_id "
+        "ON KeyInstances(account_id)")
+
+    date_updated = int(time.time())
+    conn.execute("UPDATE WalletData SET value=?, date_updated=? WHERE key=?",
+        [json.dumps(MIGRATION),date_updated,"migration"])
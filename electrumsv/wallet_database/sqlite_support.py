@@ -232,6 +232,8 @@ class DatabaseContext:
     JOURNAL_MODE = JournalModes.WAL
 
     SQLITE_CONN_POOL_SIZE = 0
+    SQLITE_CACHED_STATEMENTS = 256
+    SQLITE_CACHE_SIZE_KIB = 65536
 
     def __init__(self, wallet_path: str) -> None:
         if not self.is_special_path(wallet_path) and not wallet_path.endswith(DATABASE_EXT):
@@ -266,13 +268,24 @@ class DatabaseContext:
 
         # debug_text = traceback.format_stack()
         connection = sqlite3.connect(self._db_path, check_same_thread=False,
-            isolation_level=None)
+            isolation_level=None, cached_statements=self.SQLITE_CACHED_STATEMENTS)
         connection.execute("PRAGMA busy_timeout=5000;")
         connection.execute("PRAGMA foreign_keys=ON;")
         # We do not enable journaling for in-memory databases. It resulted in 'database is locked'
         # errors. Perhaps it works now with the locking and backoff retries.
         if not self.is_special_path(self._db_path):
-            self._ensure_journal_mode(connection)
+            journal_mode = self._ensure_journal_mode(connection)
+            # In WAL mode this is still safe from corruption, it only forgoes syncing on every
+            # commit and instead syncs at checkpoints. If the switch to WAL failed, the rollback
+            # journal is still in use and this would not be safe.
+            if journal_mode == JournalModes.WAL.value:
+                connection.execute("PRAGMA synchronous=NORMAL;")
+        # Keep temporary tables and indexes out of the filesystem, and give each connection a
+        # larger page cache (a negative value is in KiB) so repeated reads stay in memory. These
+        # are set after the journal mode as setting the cache size reads the schema, and doing
+        # that earlier can leave the journal mode switch on another connection locked out.
+        connection.execute("PRAGMA temp_store=MEMORY;")
+        connection.execute(f"PRAGMA cache_size=-{self.SQLITE_CACHE_SIZE_KIB};")
 
         # self._debug_texts[connection] = debug_text
         self._connection_pool.put(connection)
@@ -282,15 +295,19 @@ class DatabaseContext:
         connection = self._connection_pool.get_nowait()
         connection.close()
 
-    def _ensure_journal_mode(self, connection: sqlite3.Connection) -> None:
+    def _ensure_journal_mode(self, connection: sqlite3.Connection) -> str:
+        """
+        Switch the connection to the configured journal mode, returning the journal mode the
+        connection ended up in.
+        """
         with self._lock:
             cursor = connection.execute(f"PRAGMA journal_mode;")
-            journal_mode = cursor.fetchone()[0]
-            if journal_mode.upper() == self.JOURNAL_MODE.value:
-                return
+            journal_mode = cursor.fetchone()[0].upper()
+            if journal_mode == self.JOURNAL_MODE.value:
+                return journal_mode
 
             self._logger.debug("Switching database from journal mode %s to journal mode %s",
-                journal_mode.upper(), self.JOURNAL_MODE.value)
+                journal_mode, self.JOURNAL_MODE.value)
 
             time_start = time.time()
             attempt = 1
@@ -310,15 +327,16 @@ class DatabaseContext:
                         continue
                     raise
                 else:
-                    journal_mode = cursor.fetchone()[0]
-                    if journal_mode.upper() != self.JOURNAL_MODE.value:
+                    journal_mode = cursor.fetchone()[0].upper()
+                    if journal_mode != self.JOURNAL_MODE.value:
                         self._logger.error(
                             "Database unable to switch from journal mode %s to journal mode %s",
-                            self.JOURNAL_MODE.value, journal_mode.upper())
-                        return
+                            self.JOURNAL_MODE.value, journal_mode)
+                        return journal_mode
                     break
 
             self._logger.debug("Database now in journal mode %s", self.JOURNAL_MODE.value)
+            return journal_mode
 
     def get_path(self) -> str:
         return self._db_path
@@ -1,3 +1,4 @@
+from contextlib import closing
 from io import BytesIO
 import json
 try:
@@ -8,7 +9,8 @@ except ModuleNotFoundError:
     # Windows builds use the official Python 3.7.8 builds and version of 3.31.1.
     import sqlite3 # type: ignore
 import time
-from typing import Any, Dict, Iterable, NamedTuple, Optional, List, Sequence, Tuple, Type, TypeVar
+from typing import (Any, Callable, Dict, Iterable, NamedTuple, Optional, List, Sequence, Tuple,
+    Type, TypeVar)
 
 import bitcoinx
 from bitcoinx import hash_to_hex_str
@@ -70,25 +72,55 @@ def flag_clause(column: str, flags: Optional[T], mask: Optional[T]) -> Tuple[str
 
     return f"({column} & ?) == ?", [mask, flags]
 
+def row_factory(result_type: Callable[..., T]) -> Callable[[sqlite3.Cursor, Tuple[Any, ...]], T]:
+    """
+    Get a cursor row factory that builds the result type directly as each row is fetched,
+    rather than having to convert a list of fetched tuples afterwards.
+    """
+    return lambda cursor, row: result_type(*row)
+
 def collect_results(result_type: Type[T], cursor: sqlite3.Cursor, results: List[T]) -> None:
     rows = cursor.fetchall()
     cursor.close()
     results.extend(result_type(*row) for row in rows)
 
 
-def read_rows_by_id(return_type: Type[T], db: sqlite3.Connection, sql: str, params: List[Any], \
-        ids: Sequence[int]) -> List[T]:
-    results = []
-    batch_size = SQLITE_MAX_VARS - len(params)
-    while len(ids):
-        batch_ids = ids[:batch_size]
-        query = sql.format(",".join("?" for k in batch_ids))
-        cursor = db.execute(query, params + batch_ids) # type: ignore
-        rows = cursor.fetchall()
-        cursor.close()
-        results.extend(rows)
-        ids = ids[batch_size:]
-    return [ return_type(*t) for t in results ]
+# Above this many ids, `read_rows_by_id` joins against a temporary table of the ids rather than
+# formatting a parameter for each id into the statement.
+TEMP_IDS_THRESHOLD = 100
+
+# The id column is untyped so that it can hold both integer ids and transaction hashes.
+CREATE_TEMP_IDS_SQL = "CREATE TEMP TABLE IF NOT EXISTS TempIds (id PRIMARY KEY)"
+INSERT_TEMP_IDS_SQL = "INSERT OR IGNORE INTO temp.TempIds (id) VALUES (?)"
+DELETE_TEMP_IDS_SQL = "DELETE FROM temp.TempIds"
+SELECT_TEMP_IDS_SQL = "SELECT id FROM temp.TempIds"
+
+def read_rows_by_id(return_type: Callable[..., T], db: sqlite3.Connection, sql: str,
+        params: List[Any], ids: Sequence[Any]) -> List[T]:
+    """
+    Read the rows for the given `sql` restricted to the given ids, where the `sql` has an
+    `IN ({})` placeholder for where the id restriction goes.
+
+    Larger sets of ids are inserted into a temporary table, and the statement selects from that.
+    This keeps the statement text constant, so it gets reused from the statement cache, and avoids
+    having to batch around the maximum number of SQLite variables. Temporary tables are private
+    to the connection, and each store holds its connection exclusively.
+    """
+    if len(ids) > TEMP_IDS_THRESHOLD:
+        db.execute(CREATE_TEMP_IDS_SQL)
+        db.execute(DELETE_TEMP_IDS_SQL)
+        db.executemany(INSERT_TEMP_IDS_SQL, ((id_,) for id_ in ids))
+        try:
+            with closing(db.execute(sql.format(SELECT_TEMP_IDS_SQL), params)) as cursor:
+                cursor.row_factory = row_factory(return_type)
+                return cursor.fetchall()
+        finally:
+            db.execute(DELETE_TEMP_IDS_SQL)
+
+    query = sql.format(",".join("?" for k in ids))
+    with closing(db.execute(query, params + list(ids))) as cursor:
+        cursor.row_factory = row_factory(return_type)
+        return cursor.fetchall()
 
 
 class BaseWalletStore:
@@ -886,6 +918,18 @@ class TransactionDeltaTable(BaseWalletStore):
         "INNER JOIN KeyInstances AS KI ON TD.keyinstance_id = KI.keyinstance_id AND "
             "KI.account_id = ? AND TD.tx_hash = ? "
         "GROUP BY KI.account_id")
+    READ_MANY_SQL = ("SELECT TD.tx_hash, KI.account_id, TOTAL(TD.value_delta), "
+            "COUNT(TD.value_delta) "
+        "FROM TransactionDeltas AS TD "
+        "INNER JOIN KeyInstances AS KI ON TD.keyinstance_id = KI.keyinstance_id AND "
+            "TD.tx_hash IN ({}) "
+        "GROUP BY TD.tx_hash, KI.account_id")
+    READ_ACCOUNT_MANY_SQL = ("SELECT TD.tx_hash, KI.account_id, TOTAL(TD.value_delta), "
+            "COUNT(TD.value_delta) "
+        "FROM TransactionDeltas AS TD "
+        "INNER JOIN KeyInstances AS KI ON TD.keyinstance_id = KI.keyinstance_id AND "
+            "KI.account_id = ? AND TD.tx_hash IN ({}) "
+        "GROUP BY TD.tx_hash, KI.account_id")
     READ_ACCOUNT_TXFILTERING_SQL_1 = ("SELECT KI.account_id, TOTAL(TD.value_delta), "
             "COUNT(DISTINCT TD.tx_hash) "
         "FROM Transactions AS T "
@@ -930,8 +974,7 @@ class TransactionDeltaTable(BaseWalletStore):
         "FROM TransactionDeltas TD "
         "INNER JOIN PaymentRequests AS PR ON TD.keyinstance_id = PR.keyinstance_id "
         "INNER JOIN KeyInstances AS KI ON TD.keyinstance_id = KI.keyinstance_id AND "
-            "KI.account_id = ? AND TD.keyinstance_id IN ({}) AND "
-            f"(PR.state & {PaymentFlag.UNPAID}) != 0 "
+            "KI.account_id = ? AND (PR.state & ?) != 0 AND TD.keyinstance_id IN ({}) "
         "GROUP BY TD.keyinstance_id "
         "HAVING PR.value IS NULL OR PR.value <= TOTAL(TD.value_delta)")
     READ_KEY_HISTORY_SQL = ("SELECT TD.tx_hash, TD.keyinstance_id "
@@ -1063,11 +1106,9 @@ class TransactionDeltaTable(BaseWalletStore):
             return read_rows_by_id(TransactionDeltaKeySummaryRow, self._db,
                 self.READ_KEY_SUMMARY_DOMAIN_SQL, [ account_id ], keyinstance_ids)
 
-        query = self.READ_KEY_SUMMARY_SQL
-        cursor = self._db.execute(query, [account_id])
-        rows = cursor.fetchall()
-        cursor.close()
-        return [ TransactionDeltaKeySummaryRow(*t) for t in rows ]
+        with closing(self._db.execute(self.READ_KEY_SUMMARY_SQL, [account_id])) as cursor:
+            cursor.row_factory = row_factory(TransactionDeltaKeySummaryRow)
+            return cursor.fetchall()
 
     def read_history(self, account_id: int,
             keyinstance_ids: Optional[Sequence[int]]=None) -> List[TransactionDeltaHistoryRow]:
@@ -1076,16 +1117,14 @@ class TransactionDeltaTable(BaseWalletStore):
             return read_rows_by_id(TransactionDeltaHistoryRow, self._db,
                 self.READ_HISTORY_DOMAIN_SQL, [ account_id ], keyinstance_ids)
 
-        query = self.READ_HISTORY_SQL
-        cursor = self._db.execute(query, [account_id])
-        rows = cursor.fetchall()
-        cursor.close()
-        return [ TransactionDeltaHistoryRow(*t) for t in rows ]
+        with closing(self._db.execute(self.READ_HISTORY_SQL, [account_id])) as cursor:
+            cursor.row_factory = row_factory(TransactionDeltaHistoryRow)
+            return cursor.fetchall()
 
     def read_paid_requests(self, account_id: int, keyinstance_ids: Sequence[int]) \
             -> List[int]:
         return read_rows_by_id(int, self._db, self.READ_PAID_KEYS_SQL,
-            [ account_id ], keyinstance_ids)
+            [ account_id, PaymentFlag.UNPAID ], keyinstance_ids)
 
     def read_descriptions(self, account_id: int) -> List[Tuple[bytes, str]]:
         return self._get_many_common(self.READ_DESCRIPTIONS_SQL, [ account_id ])
@@ -1099,12 +1138,12 @@ class TransactionDeltaTable(BaseWalletStore):
             query += f" WHERE {clause} "
             params.extend(extra_params)
         query += self.READ_ACCOUNT_TXFILTERING_SQL_2
-        cursor = self._db.execute(query, params)
-        row = cursor.fetchone()
-        cursor.close()
+        with closing(self._db.execute(query, params)) as cursor:
+            cursor.row_factory = row_factory(TransactionDeltaSumRow)
+            row = cursor.fetchone()
         if row is None:
             return TransactionDeltaSumRow(account_id, 0, 0)
-        return TransactionDeltaSumRow(*row)
+        return row
 
     def read_transaction_value(self, tx_hash: bytes, account_id: Optional[int]=None) \
             -> List[TransactionDeltaSumRow]:
@@ -1112,9 +1151,28 @@ class TransactionDeltaTable(BaseWalletStore):
             cursor = self._db.execute(self.READ_SQL, [tx_hash])
         else:
             cursor = self._db.execute(self.READ_ACCOUNT_SQL, [account_id, tx_hash])
-        rows = cursor.fetchall()
-        cursor.close()
-        return [ TransactionDeltaSumRow(*row) for row in rows ]
+        with closing(cursor):
+            cursor.row_factory = row_factory(TransactionDeltaSumRow)
+            return cursor.fetchall()
+
+    def read_transaction_values(self, tx_hashes: Sequence[bytes],
+            account_id: Optional[int]=None) -> Dict[bytes, List[TransactionDeltaSumRow]]:
+        """
+        The batched form of `read_transaction_value`, with the rows for each transaction grouped
+        under its hash. Transactions without any deltas will not be present.
+        """
+        def _make_row(tx_hash: bytes, *values: Any) -> Tuple[bytes, TransactionDeltaSumRow]:
+            return tx_hash, TransactionDeltaSumRow(*values)
+
+        if account_id is None:
+            rows = read_rows_by_id(_make_row, self._db, self.READ_MANY_SQL, [], tx_hashes)
+        else:
+            rows = read_rows_by_id(_make_row, self._db, self.READ_ACCOUNT_MANY_SQL,
+                [ account_id ], tx_hashes)
+        results: Dict[bytes, List[TransactionDeltaSumRow]] = {}
+        for tx_hash, row in rows:
+            results.setdefault(tx_hash, []).append(row)
+        return results
 
     def update(self, entries: Iterable[Tuple[int, bytes, int]],
             date_updated: Optional[int]=None,